@@ -84,11 +84,11 @@ class MazeViewer(MatplotlibViewer):
         """
         fig, ax = self._get_fig_ax(name_suffix="_animation", show=False)
         plt.close(fig=fig)
+        img = self._add_grid_image(mazes[0], ax)
 
         def make_frame(maze: chex.Array) -> Tuple[Artist]:
-            ax.clear()
-            self._add_grid_image(maze, ax)
-            return (ax,)
+            img.set_data(self._create_grid_image(maze))
+            return (img,)
 
         # Create the animation object.
         self._animation = matplotlib.animation.FuncAnimation(
@@ -96,6 +96,7 @@ class MazeViewer(MatplotlibViewer):
             make_frame,
             frames=mazes,
             interval=interval,
+            blit=True,
         )
 
         # Save the animation as a gif.
@@ -14,12 +14,11 @@
 
 from typing import Optional, Sequence, Tuple, Union
 
-import chex
 import jax
-import jax.numpy as jnp
 import matplotlib.animation
 import matplotlib.cm
 import matplotlib.pyplot as plt
+import numpy as np
 from matplotlib import image
 from matplotlib.artist import Artist
 from matplotlib.axes import Axes
@@ -28,6 +27,19 @@ from numpy.typing import NDArray
 from jumanji.environments.commons.maze_utils.maze_rendering import MazeViewer
 from jumanji.environments.routing.pac_man.types import Observation, State
 
+# Side in pixels of the square each maze cell is drawn as.
+_CELL_SIZE = 3
+# RGB colours used by `create_grid_image`, ghosts are red, pink, cyan and orange (blue if scared).
+_GHOST_COLOURS = np.array([[1, 0, 0], [1, 0.7, 1], [0, 1, 1], [1, 0.5, 0.0]], dtype=np.float32)
+_SCARED_GHOST_COLOURS = np.array([[0, 0, 1]] * 4, dtype=np.float32)
+_GHOST_EYE_COLOUR = np.array([1, 1, 1], dtype=np.float32)
+_SCARED_GHOST_EYE_COLOUR = np.array([1, 0.6, 0.2], dtype=np.float32)
+_PELLET_COLOUR = np.array([1, 0.8, 0.6], dtype=np.float32)
+_PLAYER_COLOUR = np.array([1, 1, 0], dtype=np.float32)
+_WALL_COLOUR = np.array([0, 0, 0.6], dtype=np.float32)
+# Ghost sprite drawn over its 3 x 3 cell: 0 is the body, 1 the notches in top and 2 the eyes.
+_GHOST_SPRITE = np.array([[1, 0, 1], [2, 0, 2], [0, 0, 0]])
+
 
 class PacManViewer(MazeViewer):
     def __init__(self, name: str, render_mode: str = "human") -> None:
@@ -41,6 +53,13 @@ class PacManViewer(MazeViewer):
                 - "rgb_array": return a numpy array frame representing the environment.
         """
         super().__init__(name, render_mode)
+        # Image artist of the render figure, reused across calls to `render`.
+        self._image: Optional[image.AxesImage] = None
+        # Buffer every frame is painted into and maze background it is reset to, allocated on
+        # first use.
+        self._rgb_buffer: Optional[NDArray] = None
+        self._background: Optional[NDArray] = None
+        self._background_grid: Optional[NDArray] = None
 
     def render(
         self, state: Union[Observation, State], save_path: Optional[str] = None
@@ -56,9 +75,13 @@ class PacManViewer(MazeViewer):
         """
         self._clear_display()
         fig, ax = self._get_fig_ax()
-        ax.clear()
+        if self._image is None or self._image.axes is not ax:
+            ax.clear()
+            self._image = self._add_grid_image(state, ax)
+        else:
+            self._image.set_data(self._create_grid_image(state))
+        # `suptitle` updates the existing title artist in place.
         fig.suptitle(f"PacMan    Score: {int(state.score)}", size=15)
-        self._add_grid_image(state, ax)
 
         if save_path:
             fig.savefig(save_path, bbox_inches="tight", pad_inches=0.2)
@@ -84,15 +107,19 @@ class PacManViewer(MazeViewer):
             Animation that can be saved as a GIF, MP4, or rendered with HTML.
         """
 
+        # Pull all states to the host in one transfer instead of syncing with the device for the
+        # score and positions of every frame.
+        states = jax.device_get(list(states))
+
         fig, ax = self._get_fig_ax(name_suffix="_animation", show=False)
         plt.close(fig=fig)
-        ax.set_title("PacMan    Score: 0", size=20)
+        img = self._add_grid_image(states[0], ax)
+        title = ax.set_title(f"PacMan    Score: {int(states[0].score)}", size=20)
 
-        def make_frame(state: State) -> Tuple[Artist]:
-            ax.clear()
-            self._add_grid_image(state, ax)
-            ax.set_title(f"PacMan    Score: {int(state.score)}", size=20)
-            return (ax,)
+        def make_frame(state: State) -> Tuple[Artist, Artist]:
+            img.set_data(self._create_grid_image(state))
+            title.set_text(f"PacMan    Score: {int(state.score)}")
+            return img, title
 
         # Create the animation object.
         self._animation = matplotlib.animation.FuncAnimation(
@@ -100,212 +127,138 @@ class PacManViewer(MazeViewer):
             make_frame,
             frames=states,
             interval=interval,
+            blit=True,
         )
 
         # Save the animation as a gif.
         if save_path:
-            self._animation.save(save_path)
+            self._save_animation(self._animation, save_path, interval)
 
         return self._animation
 
     def _add_grid_image(self, state: Union[Observation, State], ax: Axes) -> image.AxesImage:
-        img = create_grid_image(state)
+        img = self._create_grid_image(state)
         ax.set_axis_off()
         return ax.imshow(img)
 
+    def _create_grid_image(self, state: Union[Observation, State]) -> NDArray:
+        """Paint the grid image of `state` into the buffer owned by the viewer. The buffer is
+        overwritten by the next call, matplotlib copies it when setting image data.
+        """
+        # The maze is static within a game, only redraw its background when it changes.
+        grid = np.asarray(state.grid)
+        if self._background is None or not np.array_equal(grid, self._background_grid):
+            self._background_grid = grid
+            self._background = _create_background(grid)
+            self._rgb_buffer = np.empty_like(self._background)
+        return create_grid_image(state, out=self._rgb_buffer, background=self._background)
+
 
 # flake8: noqa: C901
-def create_grid_image(observation: Union[Observation, State]) -> chex.Array:
+def create_grid_image(
+    observation: Union[Observation, State],
+    out: Optional[NDArray] = None,
+    background: Optional[NDArray] = None,
+) -> NDArray:
     """
     Generate the observation of the current state.
 
     Args:
         observation: `State` or `Observation` object corresponding to the new state
         of the environment.
+        out: optional C-contiguous float32 buffer of shape (3 * rows, 3 * cols, 3) to paint
+            the image into. A new array is allocated if it is None.
+        background: optional image of the maze walls, of the same shape as `out`. It is
+            computed from `observation.grid` if it is None.
 
     Returns:
         rgb: A 3-dimensional array representing the RGB observation of the current state.
+
+    Raises:
+        ValueError: if `out` is not C-contiguous or does not have the shape of the image.
     """
+    if background is None:
+        background = _create_background(np.asarray(observation.grid))
+    # Pull everything to the host once, the image is then painted in place with NumPy.
+    return _paint_grid_image(
+        background=background,
+        player_loc=(int(observation.player_locations.x), int(observation.player_locations.y)),
+        ghost_pos=np.asarray(observation.ghost_locations),
+        pellets_loc=np.asarray(observation.power_up_locations),
+        idx=np.asarray(observation.pellet_locations),
+        is_scared=int(observation.frightened_state_time) > 0,
+        out=out,
+    )
+
+
+def _create_background(grid: NDArray) -> NDArray:
+    """Draw the static part of the grid image, i.e. the maze with blue walls and black passages."""
+    n = _CELL_SIZE
+    rgb = np.zeros((*grid.shape, 3), dtype=np.float32)
+    rgb[grid == 0] = _WALL_COLOUR
+    return rgb.repeat(n, axis=0).repeat(n, axis=1)
+
+
+def _paint_grid_image(
+    background: NDArray,
+    player_loc: Tuple[int, int],
+    ghost_pos: NDArray,
+    pellets_loc: NDArray,
+    idx: NDArray,
+    is_scared: bool,
+    out: Optional[NDArray],
+) -> NDArray:
+    """Paint the sprites over the maze background into `out`, see `create_grid_image`."""
+    n = _CELL_SIZE
+    rows, cols = background.shape[0] // n, background.shape[1] // n
+    if out is None:
+        out = np.empty_like(background)
+    elif not out.flags.c_contiguous or out.shape != background.shape:
+        # Painting goes through reshaped views, which would silently be copies otherwise.
+        raise ValueError(
+            f"`out` must be a C-contiguous array of shape {background.shape}, got an array of "
+            f"shape {out.shape} with C-contiguous={out.flags.c_contiguous}."
+        )
+    player_x, player_y = player_loc
 
-    # Make walls blue and passages black
-    layer_1 = (1 - observation.grid) * 0.0
-    layer_2 = (1 - observation.grid) * 0.0
-    layer_3 = (1 - observation.grid) * 0.6
+    # Mask of the grid cells holding a pellet, eaten pellets and power pellets are zeroed out
+    idx = idx[np.any(idx != 0, axis=1)]
+    pellets_loc = pellets_loc[np.any(pellets_loc != 0, axis=1)]
+    pellet_mask = np.zeros((rows, cols), dtype=bool)
+    pellet_mask[idx[:, 1], idx[:, 0]] = True
 
-    player_loc = observation.player_locations
-    ghost_pos = observation.ghost_locations
-    pellets_loc = observation.power_up_locations
-    is_scared = observation.frightened_state_time
-    idx = observation.pellet_locations
-    n = 3
+    np.copyto(out, background)
+    # View of the image as n x n cells and strided view on the centre pixel of every cell, both
+    # indexed by grid coordinates.
+    cells = out.reshape(rows, n, cols, n, 3)
+    centres = out[1::n, 1::n]
 
     # Power pellet are pink
-    for i in range(len(pellets_loc)):
-        p = pellets_loc[i]
-        layer_1 = layer_1.at[p[1], p[0]].set(1.0)
-        layer_2 = layer_2.at[p[1], p[0]].set(0.8)
-        layer_3 = layer_3.at[p[1], p[0]].set(0.6)
+    cells[pellets_loc[:, 1], :, pellets_loc[:, 0]] = _PELLET_COLOUR
 
     # Set player is yellow
-    layer_1 = layer_1.at[player_loc.x, player_loc.y].set(1)
-    layer_2 = layer_2.at[player_loc.x, player_loc.y].set(1)
-    layer_3 = layer_3.at[player_loc.x, player_loc.y].set(0)
-
-    cr = jnp.array([1, 1, 0, 1])
-    cg = jnp.array([0, 0.7, 1, 0.5])
-    cb = jnp.array([0, 1, 1, 0.0])
-    # Set ghost locations
-
-    layers = (layer_1, layer_2, layer_3)
-
-    def set_ghost_colours(
-        layers: chex.Array,
-    ) -> Tuple[chex.Array, chex.Array, chex.Array]:
-        layer_1, layer_2, layer_3 = layers
-        for i in range(4):
-            y = ghost_pos[i][0]
-            x = ghost_pos[i][1]
-
-            layer_1 = layer_1.at[x, y].set(cr[i])
-            layer_2 = layer_2.at[x, y].set(cg[i])
-            layer_3 = layer_3.at[x, y].set(cb[i])
-        return layer_1, layer_2, layer_3
-
-    def set_ghost_colours_scared(
-        layers: chex.Array,
-    ) -> Tuple[chex.Array, chex.Array, chex.Array]:
-        layer_1, layer_2, layer_3 = layers
-        for i in range(4):
-            y = ghost_pos[i][0]
-            x = ghost_pos[i][1]
-            layer_1 = layer_1.at[x, y].set(0)
-            layer_2 = layer_2.at[x, y].set(0)
-            layer_3 = layer_3.at[x, y].set(1)
-        return layer_1, layer_2, layer_3
-
-    if is_scared > 0:
-        layers = set_ghost_colours_scared(layers)
-    else:
-        layers = set_ghost_colours(layers)
-
-    layer_1, layer_2, layer_3 = layers
-
-    layer_1 = layer_1.at[0, 0].set(0)
-    layer_2 = layer_2.at[0, 0].set(0)
-    layer_3 = layer_3.at[0, 0].set(0.6)
-
-    obs = [layer_1, layer_2, layer_3]
-    rgb = jnp.stack(obs, axis=-1)
-
-    expand_rgb = jax.numpy.kron(rgb, jnp.ones((n, n, 1)))
-    layer_1 = expand_rgb[:, :, 0]
-    layer_2 = expand_rgb[:, :, 1]
-    layer_3 = expand_rgb[:, :, 2]
+    cells[player_x, :, player_y] = _PLAYER_COLOUR
 
     # place normal pellets
-    for i in range(len(idx)):
-        if jnp.array(idx[i]).sum != 0:
-            loc = idx[i]
-            c = loc[1] * n + 1
-            r = loc[0] * n + 1
-            layer_1 = layer_1.at[c, r].set(1.0)
-            layer_2 = layer_2.at[c, r].set(0.8)
-            layer_3 = layer_3.at[c, r].set(0.6)
-
-    layers = (layer_1, layer_2, layer_3)
-
-    # Draw details
-    def set_ghost_colours_details(
-        layers: chex.Array,
-    ) -> Tuple[chex.Array, chex.Array, chex.Array]:
-        layer_1, layer_2, layer_3 = layers
-        for i in range(4):
-            y = ghost_pos[i][0]
-            x = ghost_pos[i][1]
-            c = x * n + 1
-            r = y * n + 1
-
-            layer_1 = layer_1.at[c, r].set(cr[i])
-            layer_2 = layer_2.at[c, r].set(cg[i])
-            layer_3 = layer_3.at[c, r].set(cb[i])
-
-            # Make notch in top
-            layer_1 = layer_1.at[c - 1, r - 1].set(0.0)
-            layer_2 = layer_2.at[c - 1, r - 1].set(0.0)
-            layer_3 = layer_3.at[c - 1, r - 1].set(0.0)
-
-            # Make notch in top
-            layer_1 = layer_1.at[c - 1, r + 1].set(0.0)
-            layer_2 = layer_2.at[c - 1, r + 1].set(0.0)
-            layer_3 = layer_3.at[c - 1, r + 1].set(0.0)
-
-            # Eyes
-            layer_1 = layer_1.at[c, r + 1].set(1)
-            layer_2 = layer_2.at[c, r + 1].set(1)
-            layer_3 = layer_3.at[c, r + 1].set(1)
-
-            layer_1 = layer_1.at[c, r - 1].set(1)
-            layer_2 = layer_2.at[c, r - 1].set(1)
-            layer_3 = layer_3.at[c, r - 1].set(1)
-
-        return layer_1, layer_2, layer_3
-
-    def set_ghost_colours_scared_details(
-        layers: chex.Array,
-    ) -> Tuple[chex.Array, chex.Array, chex.Array]:
-        layer_1, layer_2, layer_3 = layers
-        for i in range(4):
-            y = ghost_pos[i][0]
-            x = ghost_pos[i][1]
-
-            c = x * n + 1
-            r = y * n + 1
-
-            layer_1 = layer_1.at[x * n + 1, y * n + 1].set(0)
-            layer_2 = layer_2.at[x * n + 1, y * n + 1].set(0)
-            layer_3 = layer_3.at[x * n + 1, y * n + 1].set(1)
-
-            # Make notch in top
-            layer_1 = layer_1.at[c - 1, r - 1].set(0.0)
-            layer_2 = layer_2.at[c - 1, r - 1].set(0.0)
-            layer_3 = layer_3.at[c - 1, r - 1].set(0.0)
-
-            # Make notch in top
-            layer_1 = layer_1.at[c - 1, r + 1].set(0.0)
-            layer_2 = layer_2.at[c - 1, r + 1].set(0.0)
-            layer_3 = layer_3.at[c - 1, r + 1].set(0.0)
-
-            # Eyes
-            layer_1 = layer_1.at[c, r + 1].set(1)
-            layer_2 = layer_2.at[c, r + 1].set(0.6)
-            layer_3 = layer_3.at[c, r + 1].set(0.2)
-
-            layer_1 = layer_1.at[c, r - 1].set(1)
-            layer_2 = layer_2.at[c, r - 1].set(0.6)
-            layer_3 = layer_3.at[c, r - 1].set(0.2)
-
-        return layer_1, layer_2, layer_3
-
-    if is_scared > 0:
-        layers = set_ghost_colours_scared_details(layers)
-    else:
-        layers = set_ghost_colours_details(layers)
-
-    layer_1, layer_2, layer_3 = layers
+    centres[pellet_mask] = _PELLET_COLOUR
+
+    # Draw ghosts: the sprite of every ghost replaces its whole cell in a single assignment
+    ys = ghost_pos[:, 0]
+    xs = ghost_pos[:, 1]
+    cells[xs, :, ys] = _ghost_sprites(is_scared)
 
     # Power pellet is pink
-    for i in range(len(pellets_loc)):
-        p = pellets_loc[i]
-        layer_1 = layer_1.at[p[1] * n + 2, p[0] * n + 1].set(1)
-        layer_2 = layer_2.at[p[1] * n + 1, p[0] * n + 1].set(0.8)
-        layer_3 = layer_3.at[p[1] * n + 1, p[0] * n + 1].set(0.6)
+    centres[pellets_loc[:, 1], pellets_loc[:, 0]] = _PELLET_COLOUR
 
     # Set player is yellow
-    layer_1 = layer_1.at[player_loc.x * n + 1, player_loc.y * n + 1].set(1)
-    layer_2 = layer_2.at[player_loc.x * n + 1, player_loc.y * n + 1].set(1)
-    layer_3 = layer_3.at[player_loc.x * n + 1, player_loc.y * n + 1].set(0)
+    centres[player_x, player_y] = _PLAYER_COLOUR
+
+    return out
 
-    obs = [layer_1, layer_2, layer_3]
-    rgb = jnp.stack(obs, axis=-1)
 
-    return rgb
+def _ghost_sprites(is_scared: bool) -> NDArray:
+    """Colour the ghost sprite for every ghost, returns an array of shape (num_ghosts, 3, 3, 3)."""
+    body = _SCARED_GHOST_COLOURS if is_scared else _GHOST_COLOURS
+    eyes = _SCARED_GHOST_EYE_COLOUR if is_scared else _GHOST_EYE_COLOUR
+    palette = np.stack([body, np.zeros_like(body), np.broadcast_to(eyes, body.shape)], axis=1)
+    return palette[:, _GHOST_SPRITE]
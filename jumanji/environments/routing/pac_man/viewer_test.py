@@ -16,11 +16,13 @@ import jax
 import jax.numpy as jnp
 import matplotlib
 import matplotlib.pyplot as plt
+import numpy as np
 import py
 import pytest
+from PIL import Image, ImageSequence
 
 from jumanji.environments.routing.pac_man.env import PacMan
-from jumanji.environments.routing.pac_man.viewer import PacManViewer
+from jumanji.environments.routing.pac_man.viewer import PacManViewer, create_grid_image
 
 
 @pytest.fixture
@@ -38,6 +40,37 @@ def test_pacman_viewer__render(pac_man: PacMan, monkeypatch: pytest.MonkeyPatch)
     viewer.close()
 
 
+def test_pacman_viewer__create_grid_image_out(pac_man: PacMan) -> None:
+    key = jax.random.PRNGKey(0)
+    state, _ = pac_man.reset(key)
+    img = create_grid_image(state)
+    out = np.zeros_like(img)
+    assert create_grid_image(state, out=out) is out
+    np.testing.assert_array_equal(out, img)
+
+
+def test_pacman_viewer__create_grid_image_invalid_out(pac_man: PacMan) -> None:
+    key = jax.random.PRNGKey(0)
+    state, _ = pac_man.reset(key)
+    img = create_grid_image(state)
+    with pytest.raises(ValueError):
+        create_grid_image(state, out=np.zeros_like(img, order="F"))
+    with pytest.raises(ValueError):
+        create_grid_image(state, out=np.zeros_like(img)[:-1])
+
+
+def test_pacman_viewer__create_grid_image_skips_eaten_pellets(pac_man: PacMan) -> None:
+    key = jax.random.PRNGKey(0)
+    state, _ = pac_man.reset(key)
+    # Eaten pellets and power pellets are zeroed out and must not be drawn in the corner wall.
+    state = state.replace(  # type: ignore
+        pellet_locations=state.pellet_locations.at[0].set(0),
+        power_up_locations=state.power_up_locations.at[0].set(0),
+    )
+    img = create_grid_image(state)
+    np.testing.assert_allclose(img[:3, :3], np.broadcast_to([0.0, 0.0, 0.6], (3, 3, 3)))
+
+
 def test_robot_warehouse_viewer__animate(pac_man: PacMan) -> None:
     key = jax.random.PRNGKey(0)
     state, _ = jax.jit(pac_man.reset)(key)
@@ -74,3 +107,29 @@ def test_robot_warehouse_viewer__save_animation(pac_man: PacMan, tmpdir: py.path
     save_path = str(tmpdir.join("/pacman_animation_test.gif"))
     animation.save(save_path)
     viewer.close()
+
+
+@pytest.mark.parametrize("interval", [300, 2000])
+def test_pacman_viewer__save_animation_frame_duration(
+    pac_man: PacMan, tmpdir: py.path.local, interval: int
+) -> None:
+    key = jax.random.PRNGKey(0)
+    state, _ = jax.jit(pac_man.reset)(key)
+
+    num_steps = 3
+    states = [state]
+    for _ in range(num_steps - 1):
+        key, subkey = jax.random.split(key)
+        action = jax.random.choice(subkey, jnp.arange(4), shape=(1,))[0]
+        state, _ = jax.jit(pac_man.step)(state, action)
+        states.append(state)
+
+    viewer = PacManViewer("PacMan", render_mode="human")
+    save_path = str(tmpdir.join("/pacman_animation_test.gif"))
+    viewer.animate(states, interval=interval, save_path=save_path)
+    viewer.close()
+
+    # Pillow merges identical consecutive frames and sums their durations.
+    durations = [frame.info["duration"] for frame in ImageSequence.Iterator(Image.open(save_path))]
+    assert all(duration % interval == 0 for duration in durations)
+    assert sum(durations) == interval * num_steps
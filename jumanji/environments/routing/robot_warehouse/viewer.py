@@ -21,16 +21,16 @@ copyright."""
 from typing import Optional, Sequence, Tuple
 
 import chex
+import jax
 import matplotlib.animation as animation
 import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.artist import Artist
-from matplotlib.collections import LineCollection
+from matplotlib.collections import LineCollection, PolyCollection
 from numpy.typing import NDArray
 
 import jumanji.environments.routing.robot_warehouse.constants as constants
 from jumanji.environments.routing.robot_warehouse.types import Agent, Direction, Shelf, State
-from jumanji.tree_utils import tree_slice
 from jumanji.viewer import MatplotlibViewer
 
 
@@ -62,6 +62,12 @@ class RobotWarehouseViewer(MatplotlibViewer[State]):
         self.width = 1 + self.cols * (self.grid_size + 1)
         self.height = 1 + self.rows * (self.grid_size + 1)
 
+        # The floor grid, the goals and the agent shape never change, so their geometry is
+        # computed once.
+        self._grid_segments = self._compute_grid_segments()
+        self._goal_verts = self._compute_goal_verts()
+        self._agent_shape = self._compute_agent_shape()
+
         super().__init__(name, render_mode)
 
     def render(self, state: State, save_path: Optional[str] = None) -> Optional[NDArray]:
@@ -105,12 +111,18 @@ class RobotWarehouseViewer(MatplotlibViewer[State]):
         fig, ax = self._get_fig_ax(name_suffix="_animation", show=False)
         plt.close(fig=fig)
         self._prepare_figure(ax)
-
-        def make_frame(state: State) -> Tuple[Artist]:
-            ax.clear()
-            self._prepare_figure(ax)
-            self._draw_state(ax, state)
-            return (ax,)
+        shelves, agents, directions = self._draw_state(ax, states[0])
+
+        def make_frame(state: State) -> Tuple[Artist, Artist, Artist]:
+            shelf_data, agent_data = jax.device_get((state.shelves, state.agents))
+            shelf_verts, shelf_colors = self._shelf_polygons(shelf_data)
+            shelves.set_verts(shelf_verts)
+            shelves.set_facecolor(shelf_colors)
+            agent_verts, agent_colors, direction_segments = self._agent_polygons(agent_data)
+            agents.set_verts(agent_verts)
+            agents.set_facecolor(agent_colors)
+            directions.set_segments(direction_segments)
+            return shelves, agents, directions
 
         # Create the animation object.
         self._animation = animation.FuncAnimation(
@@ -118,11 +130,12 @@ class RobotWarehouseViewer(MatplotlibViewer[State]):
             make_frame,
             frames=states,
             interval=interval,
+            blit=True,
         )
 
         # Save the animation as a gif.
         if save_path:
-            self._animation.save(save_path)
+            self._save_animation(self._animation, save_path, interval)
 
         return self._animation
 
@@ -137,146 +150,202 @@ class RobotWarehouseViewer(MatplotlibViewer[State]):
         ax.set_yticks([])
         ax.set_frame_on(False)
 
-    def _draw_state(self, ax: plt.Axes, state: State) -> None:
-        self.n_agents = state.agents.position.x.shape[0]
-        self.n_shelves = state.shelves.position.x.shape[0]
+    def _draw_state(
+        self, ax: plt.Axes, state: State
+    ) -> Tuple[PolyCollection, PolyCollection, LineCollection]:
+        # Pull shelves and agents to the host in a single transfer, drawing only uses NumPy.
+        shelf_data, agent_data = jax.device_get((state.shelves, state.agents))
         self._draw_grid(ax)
         self._draw_goals(ax)
-        self._draw_shelves(ax, state.shelves)
-        self._draw_agents(ax, state.agents)
+        shelves = self._draw_shelves(ax, shelf_data)
+        agents, directions = self._draw_agents(ax, agent_data)
+        return shelves, agents, directions
+
+    def _compute_grid_segments(self) -> NDArray:
+        """Compute the line segments of the warehouse floor grid, of shape (n_lines, 2, 2)."""
+        cell_size = self.grid_size + 1
+        # HORIZONTAL LINES, one per row boundary
+        r: NDArray = cell_size * np.arange(self.rows + 1) + 1
+        row_lines = np.stack(
+            [
+                np.stack([np.zeros_like(r), r], axis=-1),
+                np.stack([np.full_like(r, cell_size * self.cols), r], axis=-1),
+            ],
+            axis=1,
+        )
 
-    def _draw_grid(self, ax: plt.Axes) -> None:
-        """Draw grid of warehouse floor."""
-        lines = []
-        # VERTICAL LINES
-        for r in range(self.rows + 1):
-            lines.append(
-                [
-                    (0, (self.grid_size + 1) * r + 1),
-                    ((self.grid_size + 1) * self.cols, (self.grid_size + 1) * r + 1),
-                ]
-            )
+        # VERTICAL LINES, one per column boundary
+        c: NDArray = cell_size * np.arange(self.cols + 1) + 1
+        col_lines = np.stack(
+            [
+                np.stack([c, np.zeros_like(c)], axis=-1),
+                np.stack([c, np.full_like(c, cell_size * self.rows)], axis=-1),
+            ],
+            axis=1,
+        )
 
-        # HORIZONTAL LINES
-        for c in range(self.cols + 1):
-            lines.append(
-                [
-                    ((self.grid_size + 1) * c + 1, 0),
-                    ((self.grid_size + 1) * c + 1, (self.grid_size + 1) * self.rows),
-                ]
-            )
+        return np.concatenate([row_lines, col_lines])
 
-        lc = LineCollection(lines, colors=(constants._GRID_COLOR,))
+    def _draw_grid(self, ax: plt.Axes) -> None:
+        """Draw grid of warehouse floor."""
+        lc = LineCollection(self._grid_segments, colors=(constants._GRID_COLOR,))
         ax.add_collection(lc)
 
+    def _compute_goal_verts(self) -> NDArray:
+        """Compute the vertices of the goal polygons, of shape (n_goals, 4, 2)."""
+        goals = np.asarray(self.goals)
+        x = goals[:, 0]
+        y = self.rows - goals[:, 1] - 1  # pyglet rendering is reversed
+        cell_size = self.grid_size + 1
+        x_points = np.stack(
+            [x * cell_size + 1, (x + 1) * cell_size, (x + 1) * cell_size, x * cell_size + 1],
+            axis=-1,
+        )
+        y_points = np.stack(
+            [y * cell_size + 1, y * cell_size + 1, (y + 1) * cell_size, (y + 1) * cell_size],
+            axis=-1,
+        )
+        return np.stack([x_points, y_points], axis=-1)
+
     def _draw_goals(self, ax: plt.Axes) -> None:
         """Draw goals, i.e. positions where shelves should be delivered."""
-        for goal in self.goals:
-            x, y = goal
-            y = self.rows - y - 1  # pyglet rendering is reversed
-            ax.fill(  # changed to ax, from plt, check if still works!
-                [
-                    x * (self.grid_size + 1) + 1,
-                    (x + 1) * (self.grid_size + 1),
-                    (x + 1) * (self.grid_size + 1),
-                    x * (self.grid_size + 1) + 1,
-                ],
-                [
-                    y * (self.grid_size + 1) + 1,
-                    y * (self.grid_size + 1) + 1,
-                    (y + 1) * (self.grid_size + 1),
-                    (y + 1) * (self.grid_size + 1),
-                ],
-                color=constants._GOAL_COLOR,
-                alpha=1,
+        ax.add_collection(
+            PolyCollection(
+                self._goal_verts,
+                facecolors=(constants._GOAL_COLOR,),
+                edgecolors="face",
+                joinstyle="miter",
             )
+        )
 
-    def _draw_shelves(self, ax: plt.Axes, shelves: Shelf) -> None:
+    def _draw_shelves(self, ax: plt.Axes, shelves: Shelf) -> PolyCollection:
         """Draw shelves at their respective positions.
 
         Args:
-            shelves: a pytree of Shelf type containing shelves information.
+            shelves: a pytree of Shelf type containing shelves information, on the host.
+
+        Returns:
+            the collection holding one polygon per shelf.
         """
-        for shelf_id in range(self.n_shelves):
-            shelf = tree_slice(shelves, shelf_id)
-            y, x = shelf.position.x, shelf.position.y
-            y = self.rows - y - 1  # pyglet rendering is reversed
-            shelf_color = (
-                constants._SHELF_REQ_COLOR if shelf.is_requested else constants._SHELF_COLOR
-            )
-            shelf_padding = constants._SHELF_PADDING
+        verts, colors = self._shelf_polygons(shelves)
+        collection = PolyCollection(verts, facecolors=colors, edgecolors="face", joinstyle="miter")
+        ax.add_collection(collection)
+        return collection
+
+    def _shelf_polygons(self, shelves: Shelf) -> Tuple[NDArray, NDArray]:
+        """Compute the vertices and colors of the shelf polygons.
+
+        Args:
+            shelves: a pytree of Shelf type containing shelves information, on the host.
+
+        Returns:
+            vertices of shape (n_shelves, 4, 2) and RGB colors of shape (n_shelves, 3).
+        """
+        y, x = shelves.position.x, shelves.position.y
+        y = self.rows - y - 1  # pyglet rendering is reversed
+        cell_size = self.grid_size + 1
+        shelf_padding = constants._SHELF_PADDING
+
+        x_points = np.stack(
+            [
+                cell_size * x + shelf_padding + 1,
+                cell_size * (x + 1) - shelf_padding,
+                cell_size * (x + 1) - shelf_padding,
+                cell_size * x + shelf_padding + 1,
+            ],
+            axis=-1,
+        )
+        y_points = np.stack(
+            [
+                cell_size * y + shelf_padding + 1,
+                cell_size * y + shelf_padding + 1,
+                cell_size * (y + 1) - shelf_padding,
+                cell_size * (y + 1) - shelf_padding,
+            ],
+            axis=-1,
+        )
+        verts = np.stack([x_points, y_points], axis=-1)
+        colors = np.where(
+            shelves.is_requested[:, None],
+            constants._SHELF_REQ_COLOR,
+            constants._SHELF_COLOR,
+        )
+        return verts, colors
 
-            x_points = [
-                (self.grid_size + 1) * x + shelf_padding + 1,
-                (self.grid_size + 1) * (x + 1) - shelf_padding,
-                (self.grid_size + 1) * (x + 1) - shelf_padding,
-                (self.grid_size + 1) * x + shelf_padding + 1,
-            ]
+    def _compute_agent_shape(self) -> NDArray:
+        """Compute the vertices of the agent polygon relative to the agent center, of shape
+        (resolution, 2).
+        """
+        radius = self.grid_size / 3
 
-            y_points = [
-                (self.grid_size + 1) * y + shelf_padding + 1,
-                (self.grid_size + 1) * y + shelf_padding + 1,
-                (self.grid_size + 1) * (y + 1) - shelf_padding,
-                (self.grid_size + 1) * (y + 1) - shelf_padding,
-            ]
+        resolution = 6
 
-            ax.fill(x_points, y_points, color=shelf_color)
+        # make a circle
+        angles = 2 * np.pi * np.arange(resolution) / resolution
+        return np.stack([radius * np.cos(angles) + 1, radius * np.sin(angles) + 1], axis=-1)
 
-    def _draw_agents(self, ax: plt.Axes, agents: Agent) -> None:
+    def _draw_agents(self, ax: plt.Axes, agents: Agent) -> Tuple[PolyCollection, LineCollection]:
         """Draw agents at their respective positions.
 
         Args:
-            agents: a pytree of Shelf type containing agents information.
+            agents: a pytree of Agent type containing agents information, on the host.
+
+        Returns:
+            the collection holding one polygon per agent and the collection holding the
+            direction line of each agent.
+        """
+        verts, colors, segments = self._agent_polygons(agents)
+        bodies = PolyCollection(verts, facecolors=colors, edgecolors="none")
+        directions = LineCollection(
+            segments,
+            colors=(constants._AGENT_DIR_COLOR,),
+            linewidths=2,
+            capstyle="projecting",
+            zorder=2,
+        )
+        ax.add_collection(bodies)
+        ax.add_collection(directions)
+        return bodies, directions
+
+    def _agent_polygons(self, agents: Agent) -> Tuple[NDArray, NDArray, NDArray]:
+        """Compute the vertices, colors and direction lines of the agent polygons.
+
+        Args:
+            agents: a pytree of Agent type containing agents information, on the host.
+
+        Returns:
+            vertices of shape (n_agents, resolution, 2), RGB colors of shape (n_agents, 3)
+            and direction segments of shape (n_agents, 2, 2).
         """
         radius = self.grid_size / 3
 
-        resolution = 6
+        row, col = agents.position.x, agents.position.y
+        row = self.rows - row - 1  # pyglet rendering is reversed
+        x_center = (self.grid_size + 1) * col + self.grid_size // 2 + 1
+        y_center = (self.grid_size + 1) * row + self.grid_size // 2 + 1
 
-        for agent_id in range(self.n_agents):
-            agent = tree_slice(agents, agent_id)
-            row, col = agent.position.x, agent.position.y
-            row = self.rows - row - 1  # pyglet rendering is reversed
-            x_center = (self.grid_size + 1) * col + self.grid_size // 2 + 1
-            y_center = (self.grid_size + 1) * row + self.grid_size // 2 + 1
-
-            # make a circle
-            verts = []
-            for i in range(resolution):
-                angle = 2 * np.pi * i / resolution
-
-                x_radius = radius * np.cos(angle)
-                x = x_radius + x_center + 1
-
-                y_radius = radius * np.sin(angle) + 1
-                y = y_radius + y_center
-                verts += [[x, y]]
-                facecolor = (
-                    constants._AGENT_LOADED_COLOR if agent.is_carrying else constants._AGENT_COLOR
-                )
-                circle = plt.Polygon(
-                    verts,
-                    edgecolor="none",
-                    facecolor=facecolor,
-                )
-
-            ax.add_patch(circle)
-
-            agent_dir = agent.direction
-
-            x_dir = (
-                x_center
-                + (radius if agent_dir == Direction.RIGHT.value else 0)
-                - (radius if agent_dir == Direction.LEFT.value else 0)
-            )
-            y_dir = (
-                y_center
-                + (radius if agent_dir == Direction.UP.value else 0)
-                - (radius if agent_dir == Direction.DOWN.value else 0)
-            )
+        # translate the agent shape to every agent center
+        verts = self._agent_shape + np.stack([x_center, y_center], axis=-1)[:, None]
 
-            ax.plot(
-                [x_center, x_dir],
-                [y_center, y_dir],
-                color=constants._AGENT_DIR_COLOR,
-                linewidth=2,
-            )
+        colors = np.where(
+            agents.is_carrying[:, None],
+            constants._AGENT_LOADED_COLOR,
+            constants._AGENT_COLOR,
+        )
+
+        agent_dir = agents.direction
+        x_dir = (
+            x_center
+            + radius * (agent_dir == Direction.RIGHT.value)
+            - radius * (agent_dir == Direction.LEFT.value)
+        )
+        y_dir = (
+            y_center
+            + radius * (agent_dir == Direction.UP.value)
+            - radius * (agent_dir == Direction.DOWN.value)
+        )
+        segments = np.stack(
+            [np.stack([x_center, y_center], axis=-1), np.stack([x_dir, y_dir], axis=-1)], axis=1
+        )
+
+        return verts, colors, segments
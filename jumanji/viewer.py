@@ -90,6 +90,7 @@ class MatplotlibViewer(Viewer, abc.ABC, Generic[State]):
         """
         self._name = name
         self._animation: Optional[animation.Animation] = None
+        self._writer: Optional[animation.PillowWriter] = None
         self.figure_size = figure_size
 
         # Render interactive animations in Jupyter
@@ -154,6 +155,24 @@ class MatplotlibViewer(Viewer, abc.ABC, Generic[State]):
 
         return fig, ax
 
+    def _save_animation(self, anim: animation.Animation, save_path: str, interval: int) -> None:
+        """
+        Save an animation, GIFs reuse the same Pillow writer across calls.
+
+        Args:
+            anim: the animation to save.
+            save_path: the path where the animation file should be saved.
+            interval: delay between frames in milliseconds.
+        """
+        if not save_path.endswith(".gif"):
+            anim.save(save_path)
+            return
+        # Same frame rate as `Animation.save` derives from the interval.
+        fps = 1000 / interval
+        if self._writer is None or self._writer.fps != fps:
+            self._writer = animation.PillowWriter(fps=fps)  # type: ignore
+        anim.save(save_path, writer=self._writer)
+
     def _display_human(self, fig: plt.Figure) -> None:
         if plt.isinteractive():
             # Required to update render when using Jupyter Notebook.